@@ -9,31 +9,86 @@ Data sources (by priority):
 - Wages, growth labels, openings: scraped from O*NET Online (not in DB)
 - Growth numeric: BLS Employment Projections CSV
 
-Uses a JSON cache for resumability of scraped data.
+Uses an append-only JSON Lines cache for resumability of scraped data.
 Outputs to intermediate CSV files in the data directory.
 """
 
 import csv
 import json
 import re
+import threading
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from html.parser import HTMLParser
 from pathlib import Path
 
 import openpyxl
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    import orjson
+    def jdumps(obj) -> str:  # C-backed, ~3-5x faster than stdlib json
+        return orjson.dumps(obj).decode()
+    jloads = orjson.loads
+except ImportError:
+    jdumps = json.dumps
+    jloads = json.loads
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 INPUT_CSV = DATA_DIR / "input" / "All_Occupations_ONET.csv"
 EMPLOYMENT_PROJECTIONS_CSV = DATA_DIR / "input" / "Employment Projections.csv"
 ALTPATH_CSV = DATA_DIR / "input" / "SimpleJobTitles_altPathurl_202602201636.csv"
 ONET_DB_DIR = DATA_DIR / "input" / "onet_db"
-CACHE_FILE = DATA_DIR / "intermediate" / "onet_scrape_cache.json"
+CACHE_FILE = DATA_DIR / "intermediate" / "onet_scrape_cache.jsonl"
+LEGACY_CACHE_FILE = DATA_DIR / "intermediate" / "onet_scrape_cache.json"
 ENRICHMENT_ONLY_CSV = DATA_DIR / "intermediate" / "onet_enrichment.csv"
 ENRICHED_CSV = DATA_DIR / "intermediate" / "All_Occupations_ONET_enriched.csv"
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (research project)"}
-DELAY = 1.0  # seconds between requests to be polite
+# Request *starts* are spaced by RateLimiter across all workers, so this is
+# the actual load O*NET sees regardless of MAX_WORKERS. O*NET publishes no
+# crawl guidance; 2 req/s is a modest bump over the old serial ~1 req/s —
+# raise with care.
+GLOBAL_REQS_PER_SEC = 2.0
+MAX_WORKERS = 8  # concurrent scrape threads (network I/O releases the GIL)
+
+# Shared session: HTTPS keep-alive reuses connections instead of paying a
+# fresh TCP+TLS handshake per page, with retries on transient server errors.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+
+class RateLimiter:
+    """Enforce one request per `min_interval` seconds globally across threads.
+
+    Workers overlap their waiting on O*NET responses, but request *starts*
+    stay spaced out so the polite rate is honored regardless of worker count.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
 
 # Map ETE category numbers to short labels matching our existing output format.
 # Category descriptions from ETE Categories.xlsx, shortened for CSV output.
@@ -280,25 +335,28 @@ class OnetPageParser(HTMLParser):
 
     def finalize_education(self):
         """Extract top 2 education responses after parsing is complete."""
-        if not self._education_items:
-            return
-
-        cleaned = []
-        for item in self._education_items:
-            text = re.sub(r"\s+", " ", item).strip()
-            text = text.replace("requiredmore info", "")
-            text = text.replace("required", "").strip()
-            text = text.replace("responded:", "").strip()
-            match = re.search(r"(\d+)\s*%\s*(.*)", text)
-            if match:
-                pct = match.group(1)
-                level = match.group(2).strip()
-                if level:
-                    cleaned.append((int(pct), f"{pct}% {level}"))
-
-        if cleaned:
-            cleaned.sort(key=lambda x: x[0], reverse=True)
-            self.education_top_2 = " | ".join(item[1] for item in cleaned[:2])
+        self.education_top_2 = _education_top_2_from_items(self._education_items)
+
+
+def _education_top_2_from_items(items: list) -> str | None:
+    """Clean raw education survey <li> texts and keep the top 2 by percentage."""
+    cleaned = []
+    for item in items:
+        text = re.sub(r"\s+", " ", item).strip()
+        text = text.replace("requiredmore info", "")
+        text = text.replace("required", "").strip()
+        text = text.replace("responded:", "").strip()
+        match = re.search(r"(\d+)\s*%\s*(.*)", text)
+        if match:
+            pct = match.group(1)
+            level = match.group(2).strip()
+            if level:
+                cleaned.append((int(pct), f"{pct}% {level}"))
+
+    if not cleaned:
+        return None
+    cleaned.sort(key=lambda x: x[0], reverse=True)
+    return " | ".join(item[1] for item in cleaned[:2])
 
 
 def _education_from_jobzone(text: str) -> str:
@@ -329,12 +387,163 @@ def _education_from_jobzone(text: str) -> str:
     return ""
 
 
-def fetch_onet_page(url: str) -> dict:
-    """Scrape wage, growth, openings, and education from an O*NET page."""
-    req = urllib.request.Request(url, headers=HEADERS)
-    resp = urllib.request.urlopen(req, timeout=30)
-    html = resp.read().decode("utf-8", errors="replace")
+# Fast-path extraction: pre-compiled regexes cover the standard O*NET page
+# layout, so the pure-Python HTMLParser state machine (slow per-token) only
+# runs on pages that deviate from it.
+def _dt_dd_pattern(label: str) -> re.Pattern:
+    # .*? between the label and </dt> tolerates nested markup (e.g. a year
+    # span or "more info" link inside the <dt>).
+    return re.compile(
+        rf"<dt[^>]*>[^<]*{label}.*?</dt>\s*<dd[^>]*>(.*?)</dd>", re.S)
+
+_WAGE_RE        = _dt_dd_pattern("Median wages")
+_GROWTH_RE      = _dt_dd_pattern("Projected growth")
+_OPENINGS_RE    = _dt_dd_pattern("Projected job openings")
+_JOBZONE_EDU_RE = re.compile(r"<dt[^>]*>\s*Education\s*</dt>\s*<dd[^>]*>(.*?)</dd>", re.S)
+_P_RE           = re.compile(r"<p[^>]*>(.*?)</p>", re.S)
+_LI_RE          = re.compile(r"<li[^>]*>(.*?)</li>", re.S)
+_EDU_SECTION_RE = re.compile(
+    r"(?:How much education does a new hire need|Respondents said)(.*?)</(?:ul|ol)>", re.S)
+_TAG_RE         = re.compile(r"<[^>]+>")
+_WS_RE          = re.compile(r"\s+")
+
+
+def _strip_tags(fragment: str) -> str:
+    return _WS_RE.sub(" ", _TAG_RE.sub("", fragment)).strip()
+
+
+def _parse_page_fast(html: str) -> dict | None:
+    """Regex extraction for the standard page layout.
+
+    Returns None if any of the three wage/growth/openings <dt>/<dd> pairs
+    fails to match, in which case the caller falls back to OnetPageParser.
+    """
+    matches = [pattern.search(html) for pattern in (_WAGE_RE, _GROWTH_RE, _OPENINGS_RE)]
+    if not all(matches):
+        return None
+    wage, growth, openings = (_strip_tags(m.group(1)) for m in matches)
+
+    jz_match = _JOBZONE_EDU_RE.search(html)
+    jobzone_education = _strip_tags(jz_match.group(1)) if jz_match else ""
+
+    description = ""
+    for m in _P_RE.finditer(html):
+        p_text = _strip_tags(m.group(1))
+        if len(p_text) > 50 and "A subset of this occupation" not in p_text:
+            description = p_text
+            break
+
+    edu_match = _EDU_SECTION_RE.search(html)
+    edu_items = []
+    if edu_match:
+        edu_items = [_strip_tags(li) for li in _LI_RE.findall(edu_match.group(1))
+                     if "%" in li]
+
+    return {
+        "median_wage": wage,
+        "projected_growth": growth,
+        "projected_job_openings": openings,
+        "education_top_2": _education_top_2_from_items(edu_items) or "",
+        "jobzone_education_text": jobzone_education,
+        "description": description,
+    }
+
+
+_DT_LABELS = [
+    ("Median wages", "median_wage"),
+    ("Projected growth", "projected_growth"),
+    ("Projected job openings", "projected_job_openings"),
+]
+
 
+def _parse_page_lxml(html: str) -> dict | None:
+    """Full-page extraction via lxml's C parser.
+
+    Covers the same fields as OnetPageParser without html.parser's per-token
+    Python dispatch. Used when the regex fast path misses and lxml is
+    installed; returns None if lxml is unavailable or the page is empty.
+    """
+    if etree is None:
+        return None
+    tree = etree.HTML(html)
+    if tree is None:
+        return None
+
+    def text_of(el) -> str:
+        # "".join, not " ".join: adjacent text nodes must concatenate without
+        # an inserted space so education <li>s read "requiredmore info" and
+        # _education_top_2_from_items' cleanup still matches, exactly as in
+        # the regex and HTMLParser tiers.
+        return _WS_RE.sub(" ", "".join(el.itertext())).strip()
+
+    fields = {
+        "median_wage": "",
+        "projected_growth": "",
+        "projected_job_openings": "",
+        "jobzone_education_text": "",
+    }
+    for dt in tree.iter("dt"):
+        label = text_of(dt)
+        key = next((k for needle, k in _DT_LABELS if needle in label), None)
+        if key is None and label == "Education":
+            key = "jobzone_education_text"
+        if key is None or fields[key]:
+            continue
+        dd = dt.getnext()
+        if dd is not None and dd.tag == "dd":
+            fields[key] = text_of(dd)
+
+    description = ""
+    for p in tree.iter("p"):
+        p_text = text_of(p)
+        if len(p_text) > 50 and "A subset of this occupation" not in p_text:
+            description = p_text
+            break
+
+    # Education survey: every <li> after the survey question, as in the
+    # HTMLParser path (non-percentage items are filtered out downstream).
+    edu_items = []
+    past_anchor = False
+    for el in tree.iter():
+        if not past_anchor:
+            if el.text and ("How much education does a new hire need" in el.text
+                            or "Respondents said" in el.text):
+                past_anchor = True
+            continue
+        if el.tag == "li":
+            li_text = text_of(el)
+            if "%" in li_text:
+                edu_items.append(li_text)
+
+    fields["education_top_2"] = _education_top_2_from_items(edu_items) or ""
+    fields["description"] = description
+    return fields
+
+
+def load_scrape_cache() -> dict:
+    """Rebuild the in-memory scrape cache, one JSONL record per occupation.
+
+    Later lines win, so a re-scraped occupation just appends a fresh record.
+    Entries from the legacy whole-dict JSON cache are loaded first.
+    """
+    cache = {}
+    if LEGACY_CACHE_FILE.exists():
+        with open(LEGACY_CACHE_FILE) as f:
+            cache.update(jloads(f.read()))
+    if CACHE_FILE.exists():
+        with open(CACHE_FILE) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = jloads(line)
+                code = record.pop("code")
+                cache[code] = record
+    return cache
+
+
+def _parse_page_htmlparser(html: str) -> dict:
+    """Pure-Python HTMLParser extraction — the always-available last tier."""
     parser = OnetPageParser()
     parser.feed(html)
     parser.finalize_education()
@@ -349,6 +558,23 @@ def fetch_onet_page(url: str) -> dict:
     }
 
 
+def fetch_onet_page(url: str) -> dict:
+    """Scrape wage, growth, openings, and education from an O*NET page."""
+    resp = SESSION.get(url, timeout=30)
+    resp.raise_for_status()
+    html = resp.text
+
+    fast = _parse_page_fast(html)
+    if fast is not None:
+        return fast
+
+    parsed = _parse_page_lxml(html)
+    if parsed is not None:
+        return parsed
+
+    return _parse_page_htmlparser(html)
+
+
 # ---------------------------------------------------------------------------
 # CSV output helpers
 # ---------------------------------------------------------------------------
@@ -398,19 +624,16 @@ def main():
     print(f"  Employment Projections: {len(growth_lookup)} occupations")
 
     # 4. Load scrape cache
-    scrape_cache = {}
-    if CACHE_FILE.exists():
-        with open(CACHE_FILE) as f:
-            scrape_cache = json.load(f)
+    scrape_cache = load_scrape_cache()
 
     # Also migrate old cache format if it exists
     old_cache = DATA_DIR / "intermediate" / "onet_enrichment_cache.json"
     old_cache_data = {}
     if old_cache.exists():
         with open(old_cache) as f:
-            old_cache_data = json.load(f)
+            old_cache_data = jloads(f.read())
         # Migrate into scrape cache (wage/growth/openings + education)
-        if not CACHE_FILE.exists():
+        if not scrape_cache:
             for code, entry in old_cache_data.items():
                 if code not in scrape_cache:
                     scrape_cache[code] = {
@@ -442,28 +665,43 @@ def main():
 
     to_scrape = [r for r in rows if _needs_scrape(r["Code"])]
     if to_scrape:
-        print(f"Scraping {len(to_scrape)} occupations...")
-        for i, row in enumerate(to_scrape):
-            code = row["Code"]
-            url = row["url"]
-            print(f"  [{i+1}/{len(to_scrape)}] {code} - {row['Occupation']}...")
-            try:
-                data = fetch_onet_page(url)
-                scrape_cache[code] = data
-                print(f"    Wage: {data['median_wage']}, Edu: {data['education_top_2'][:50]}")
-            except Exception as e:
-                print(f"    ERROR: {e}")
-                scrape_cache[code] = {
-                    "median_wage": "",
-                    "projected_growth": "",
-                    "projected_job_openings": "",
-                    "education_top_2": "",
-                    "jobzone_education_text": "",
-                }
-
-            with open(CACHE_FILE, "w") as f:
-                json.dump(scrape_cache, f, indent=2)
-            time.sleep(DELAY)
+        print(f"Scraping {len(to_scrape)} occupations ({MAX_WORKERS} workers, "
+              f"{GLOBAL_REQS_PER_SEC:g} req/s global)...")
+        limiter = RateLimiter(1.0 / GLOBAL_REQS_PER_SEC)
+        cache_lock = threading.Lock()
+
+        def scrape_one(row):
+            limiter.acquire()
+            return fetch_onet_page(row["url"])
+
+        # Line-buffered append: persisting a fetch is one O(1) write instead
+        # of re-serializing the whole growing cache, and each line lands on
+        # disk immediately so a crash loses at most the in-flight fetches.
+        done = 0
+        with open(CACHE_FILE, "a", buffering=1) as cache_fh, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {pool.submit(scrape_one, row): row for row in to_scrape}
+            for future in as_completed(futures):
+                row = futures[future]
+                code = row["Code"]
+                done += 1
+                print(f"  [{done}/{len(to_scrape)}] {code} - {row['Occupation']}...")
+                try:
+                    data = future.result()
+                    print(f"    Wage: {data['median_wage']}, Edu: {data['education_top_2'][:50]}")
+                except Exception as e:
+                    print(f"    ERROR: {e}")
+                    data = {
+                        "median_wage": "",
+                        "projected_growth": "",
+                        "projected_job_openings": "",
+                        "education_top_2": "",
+                        "jobzone_education_text": "",
+                    }
+
+                with cache_lock:
+                    scrape_cache[code] = data
+                    cache_fh.write(jdumps({"code": code, **data}) + "\n")
     else:
         print("All pages already cached.")
 
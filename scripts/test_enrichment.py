@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
-Test the O*NET enrichment pipeline on two sets of occupations:
+Test the O*NET enrichment pipeline:
+
+0. Parser-tier equivalence — run the regex fast path, the lxml tier, and the
+   HTMLParser tier on the same fixture page and verify they extract identical
+   fields (no network required).
 
 1. First 5 rows of data/input/All_Occupations_ONET.csv — broad sanity check
    that the pipeline runs without errors on real input data.
@@ -32,6 +36,9 @@ from enrich_onet import (
     load_altpath_data,
     extract_top_education,
     _education_from_jobzone,
+    _parse_page_fast,
+    _parse_page_lxml,
+    _parse_page_htmlparser,
     INPUT_CSV,
 )
 
@@ -61,6 +68,83 @@ TEST_CASES = [
 ]
 
 
+# Minimal O*NET summary page in the standard layout. The education <li>s
+# deliberately split "required" and "more info" across adjacent nodes
+# (text + <a> tag), the shape that produces the "requiredmore info" artifact
+# every tier's cleanup must strip identically.
+FIXTURE_HTML = """\
+<html><body>
+<p>Short intro.</p>
+<p>Direct activities of workers engaged in sample tasks across a broad range
+of industries, coordinating schedules and reviewing output for quality.</p>
+<dl>
+<dt>Median wages<span> (2024)</span></dt>
+<dd>$49.50 hourly, $102,950 annual</dd>
+<dt>Projected growth<span> (2024-2034)</span></dt>
+<dd><span>Faster than average (5% or higher)</span></dd>
+<dt>Projected job openings<span> (2024-2034)</span></dt>
+<dd>12,300</dd>
+<dt>Education</dt>
+<dd>Most of these occupations require a four-year bachelor's degree, but some do not.</dd>
+</dl>
+<h2>How much education does a new hire need to perform a job in this occupation?</h2>
+<ul>
+<li><b>45%</b> responded: Bachelor's degree required<a href="#">more info</a></li>
+<li><b>30%</b> responded: Master's degree required<a href="#">more info</a></li>
+<li><b>25%</b> responded: Associate's degree required<a href="#">more info</a></li>
+</ul>
+</body></html>
+"""
+
+
+def run_parser_equivalence():
+    """Run all three extraction tiers on FIXTURE_HTML and compare fields."""
+    print(f"{'='*80}")
+    print("Parser-tier equivalence on fixture page")
+    print(f"{'='*80}")
+
+    tiers = {
+        "fast (regex)": _parse_page_fast(FIXTURE_HTML),
+        "lxml": _parse_page_lxml(FIXTURE_HTML),
+        "htmlparser": _parse_page_htmlparser(FIXTURE_HTML),
+    }
+    if tiers["lxml"] is None:
+        print("  ⚠ lxml not installed — skipping that tier")
+        del tiers["lxml"]
+
+    passed = True
+    if tiers["fast (regex)"] is None:
+        print("  [FAIL] fast (regex): fixture did not match the fast path")
+        return False
+
+    baseline_name = "htmlparser"
+    baseline = tiers[baseline_name]
+    fields = sorted(baseline.keys())
+    for name, parsed in tiers.items():
+        if name == baseline_name:
+            continue
+        for field in fields:
+            if parsed.get(field) != baseline[field]:
+                passed = False
+                print(f"  [FAIL] {name} vs {baseline_name} on {field!r}:")
+                print(f"         {name}: {parsed.get(field)!r}")
+                print(f"         {baseline_name}: {baseline[field]!r}")
+
+    edu = baseline["education_top_2"]
+    if "more info" in edu or "required" in edu:
+        passed = False
+        print(f"  [FAIL] education cleanup left artifacts: {edu!r}")
+    if edu != "45% Bachelor's degree | 30% Master's degree":
+        passed = False
+        print(f"  [FAIL] unexpected education_top_2: {edu!r}")
+
+    for name, parsed in tiers.items():
+        print(f"  {name}: education_top_2 = {parsed['education_top_2']!r}")
+    status = "PASS" if passed else "FAIL"
+    print(f"\n  [{status}] {len(tiers)} tiers compared on {len(fields)} fields\n")
+    return passed
+
+
 def run_case(code, url, label, expected_edu_source, db_education, db_descriptions, db_titles, growth_lookup, altpath_lookup):
     """Scrape and enrich a single occupation. Returns (result_dict, passed)."""
     print(f"{'='*80}")
@@ -147,6 +231,12 @@ def main():
     print("\nO*NET Enrichment Test")
     print(f"{'='*80}\n")
 
+    # --- Part 0: parser-tier equivalence (offline) ---
+    print(f"\n{'#'*80}")
+    print(f"# PART 0: Parser-tier equivalence (fixture, no network)")
+    print(f"{'#'*80}\n")
+    all_passed = run_parser_equivalence()
+
     # Load DB sources
     print("Loading O*NET DB files...")
     db_education = load_education_data()
@@ -161,7 +251,6 @@ def main():
     print(f"  Altpath data: {len(altpath_lookup)} occupations\n")
 
     results = []
-    all_passed = True
 
     # --- Part 1: First N rows from input CSV (sanity check) ---
     print(f"\n{'#'*80}")
@@ -17,7 +17,7 @@ import anthropic
 import json
 from score_occupations import (
     load_skill, load_occupations, write_scores_to_csv,
-    parse_response, build_prompt, compute_rankings, SCORE_COLUMNS,
+    parse_response, build_system, build_user_message, compute_rankings, SCORE_COLUMNS,
 )
 
 ONET_CSV = "data/intermediate/All_Occupations_ONET_enriched.csv"
@@ -107,7 +107,6 @@ def main():
     skill_text = load_skill(SKILL_MD)
     occupations = load_occupations(ONET_CSV)
     test_batch = occupations[:TEST_BATCH_SIZE]
-    source_lookup = {o["Code"]: o for o in occupations}
 
     if not test_batch:
         print("Error: No occupations found")
@@ -127,14 +126,14 @@ def main():
 
     # Build and send prompt
     print(f"\n✓ Generated scoring framework")
-    prompt = build_prompt(test_batch, skill_text)
+    prompt = build_user_message(test_batch)
 
     try:
         print("🔄 Calling Claude API...")
         response = client.messages.create(
             model=MODEL,
             max_tokens=MAX_TOKENS,
-            system=skill_text,
+            system=build_system(skill_text),
             messages=[{"role": "user", "content": prompt}]
         )
         raw = response.content[0].text
@@ -154,7 +153,7 @@ def main():
     display_results(results)
 
     # Write to CSV and compute rankings
-    write_scores_to_csv(results, OUTPUT_CSV, source_lookup, append=False)
+    write_scores_to_csv(results, OUTPUT_CSV, append=False)
     compute_rankings(OUTPUT_CSV)
     print(f"✓ Results written to: {OUTPUT_CSV}")
     